@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import os
 import sys
 from datetime import datetime
@@ -7,11 +8,12 @@ from datetime import datetime
 app = FastAPI(
     title="Mi Primera API FastAPI",
     description="API de verificación para setup del bootcamp",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 @app.get("/")
-def home():
+async def home():
     """Endpoint principal de verificación"""
     return {
         "message": "¡Setup completado correctamente!",
@@ -21,7 +23,7 @@ def home():
     }
 
 @app.get("/info/setup")
-def info_setup():
+async def info_setup():
     """Información del entorno de desarrollo"""
     return {
         "python_version": sys.version,
@@ -33,7 +35,7 @@ def info_setup():
     }
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Endpoint de verificación de salud"""
     return {
         "status": "healthy",
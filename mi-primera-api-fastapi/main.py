@@ -1,52 +1,55 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 # Crear la aplicación (lo más simple posible)
-app = FastAPI(title="Mi Primera API")
+app = FastAPI(title="Mi Primera API", default_response_class=ORJSONResponse)
 
 # Endpoint 1: Hello World (OBLIGATORIO)
 @app.get("/")
-def hello_world():
+async def hello_world():
     return {"message": "¡Mi primera API FastAPI!"}
 
 # Endpoint 2: Info básica (OBLIGATORIO)
 @app.get("/info")
-def info():
+async def info():
     return {"api": "FastAPI", "week": 1, "status": "running"}
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 # Crear la aplicación (lo más simple posible)
-app = FastAPI(title="Mi Primera API")
+app = FastAPI(title="Mi Primera API", default_response_class=ORJSONResponse)
 
 # Endpoint 1: Hello World (OBLIGATORIO)
 @app.get("/")
-def hello_world():
+async def hello_world():
     return {"message": "¡Mi primera API FastAPI!"}
 
 # Endpoint 2: Info básica (OBLIGATORIO)
 @app.get("/info")
-def info():
+async def info():
     return {"api": "FastAPI", "week": 1, "status": "running"}
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI(title="Mi Primera API")
+app = FastAPI(title="Mi Primera API", default_response_class=ORJSONResponse)
 
 @app.get("/")
-def hello_world():
+async def hello_world():
     return {"message": "¡Mi primera API FastAPI!"}
 
 @app.get("/info")
-def info():
+async def info():
     return {"api": "FastAPI", "week": 1, "status": "running"}
 
 # NUEVO: Endpoint personalizado (solo si hay tiempo)
 @app.get("/greeting/{name}")
-def greet_user(name: str):
+async def greet_user(name: str):
     return {"greeting": f"¡Hola {name}!"}
 
 @app.get("/my-profile")
-def my_profile():
+async def my_profile():
     return {
         "name": "Tu Nombre Aquí",           # Cambiar por tu nombre
         "bootcamp": "FastAPI",